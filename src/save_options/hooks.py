@@ -5,9 +5,8 @@ from typing import TYPE_CHECKING, Any
 from unrealsdk import logging
 from unrealsdk.hooks import Type
 
-import save_options.options
 from mods_base import JSON, get_pc, hook
-from save_options.options import set_option_to_default, trigger_save
+from save_options.options import option_change_flag, set_option_to_default, trigger_save
 from save_options.registration import (
     ModSaveOptions,
     load_callbacks,
@@ -22,35 +21,52 @@ if TYPE_CHECKING:
 # Value doesn't matter, just needs to be consistent and higher than any real DLC package ID
 _PACKAGE_ID: int = 99
 
+# Created once rather than per dumps call. Uses the same default separators as `json.dumps`, so the
+# data written into the save file doesn't change.
+_JSON_ENCODER = json.JSONEncoder()
+
 
 def _extract_save_data(
     lockout_list: WrappedArray[WrappedStruct],
-) -> dict[str, dict[str, JSON]]:
+    *,
+    keep_entry: bool = False,
+) -> tuple[dict[str, dict[str, JSON]], WrappedStruct | None]:
     """
     Extracts custom save data from an UnloadableDlcLockoutList.
 
     This function searches through the list for an entry matching the global `_PACKAGE_ID`.
     If found, it attempts to parse the `LockoutDefName` field as a JSON string into a dictionary.
     Invalid or malformed JSON will result in an empty dictionary and an error being logged.
-    All entries matching the `_PACKAGE_ID` are removed in place.
+    All entries matching the `_PACKAGE_ID` are removed in place, unless `keep_entry` is set, in
+    which case the first one is left in the list so that it may be overwritten.
 
     Args:
         lockout_list: List of LockoutData structs from the character save file.
+        keep_entry: If true, don't remove the first matching entry from the list.
     Returns:
-        A dictionary of extracted save data (empty if not found or invalid).
+        A tuple of a dictionary of extracted save data (empty if not found or invalid), and the
+        entry which was kept in the list (None if not found, or if not keeping it).
     """
 
-    matching_lockout_data = next(
-        (lockout_data for lockout_data in lockout_list if lockout_data.DlcPackageId == _PACKAGE_ID),
-        None,
+    # Most saves contain nothing but our entry, if anything, so bail out before walking the list
+    # a second time if it isn't there
+    match_idx, matching_lockout_data = next(
+        (
+            (idx, lockout_data)
+            for idx, lockout_data in enumerate(lockout_list)
+            if lockout_data.DlcPackageId == _PACKAGE_ID
+        ),
+        (None, None),
     )
-    if not matching_lockout_data:
-        return {}
+    if match_idx is None or matching_lockout_data is None:
+        return {}, None
 
+    # Every field access goes through the sdk, only read it the once
+    lockout_def_name: str = matching_lockout_data.LockoutDefName
     extracted_save_data: dict[str, dict[str, JSON]] = {}
-    if matching_lockout_data.LockoutDefName:
+    if lockout_def_name:
         try:
-            extracted_save_data = json.loads(matching_lockout_data.LockoutDefName)
+            extracted_save_data = json.loads(lockout_def_name)
         except JSONDecodeError:
             # Invalid data, just clear the contents
             logging.error("Error extracting custom save data from save file, invalid JSON found.")
@@ -58,23 +74,25 @@ def _extract_save_data(
         # Pylance saying this instance check unnecessary, but json.loads can return valid non-dict
         # objects.
         if not isinstance(extracted_save_data, dict):  # pyright: ignore[reportUnnecessaryIsInstance]
-            logging.error(
-                f"Could not load dict object from custom save string:"
-                f" {matching_lockout_data.LockoutDefName}",
-            )
+            logging.error(f"Could not load dict object from custom save string: {lockout_def_name}")
             extracted_save_data = {}
 
     # Remove all our entries from the list
     # This is done in a bit of a weird, unpythonic way, to be extra safe with regards to the
-    # structs. Structs are reference types, so removing one shifts all other references.
-    i = 0
-    while i < len(lockout_list):
+    # structs. Structs are reference types, so removing one shifts all other references. Since
+    # we're only ever removing entries after the kept one, its reference stays valid.
+    # Everything before the first match is known not to be ours, so we can start from there.
+    # We're the only thing changing the length, so track it ourselves rather than asking each time.
+    i = match_idx + 1 if keep_entry else match_idx
+    list_len = len(lockout_list)
+    while i < list_len:
         if lockout_list[i].DlcPackageId == _PACKAGE_ID:
             del lockout_list[i]
+            list_len -= 1
             continue
         i += 1
 
-    return extracted_save_data
+    return extracted_save_data, (matching_lockout_data if keep_entry else None)
 
 
 @hook("WillowGame.WillowSaveGameManager:SaveGame", immediately_enable=True)
@@ -84,20 +102,20 @@ def save_game(_1: UObject, args: WrappedStruct, _3: Any, _4: BoundFunction) -> N
     # to add a safety check at some point.1M characters has worked fine, so unlikely to be an issue.
 
     # For callbacks, only process enabled mods and only when we're in game. We'll run these first so
-    # mod can use it to set values on the save options.
-    enabled_mods = [mod_id for mod_id, mod in registered_mods.items() if mod.is_enabled]
-
+    # mod can use it to set values on the save options. All three registries share the same keys,
+    # so we can look the mod up directly rather than building a list of enabled ones first.
     if get_pc().GetWillowPlayerPawn():
         for mod_id, callback in save_callbacks.items():
-            if mod_id in enabled_mods:
+            if registered_mods[mod_id].is_enabled:
                 callback()
 
     # For saving, we'll overwrite existing mod data for enabled mods. Any disabled/uninstalled mods
     # will have their data left alone.
     lockout_list = args.SaveGame.UnloadableDlcLockoutList
-    json_save_data = _extract_save_data(lockout_list)
+    # Keep our existing entry around, so we can overwrite it instead of re-allocating the array
+    json_save_data, existing_entry = _extract_save_data(lockout_list, keep_entry=True)
     for mod_id, mod_data in registered_save_options.items():
-        if mod_id in enabled_mods:
+        if registered_mods[mod_id].is_enabled:
             mod_save_data = {
                 identifier: option_json
                 for identifier, save_option in mod_data.items()
@@ -106,20 +124,23 @@ def save_game(_1: UObject, args: WrappedStruct, _3: Any, _4: BoundFunction) -> N
             try:
                 # Only calling this to validate the types, so one mod failing doesn't break
                 # everything below.
-                _ = json.dumps(mod_save_data)
+                _ = _JSON_ENCODER.encode(mod_save_data)
                 json_save_data[mod_id] = mod_save_data
             except TypeError:
                 logging.error(f"Could not write save-specific data for {mod_id}.")
                 logging.dev_warning(f"Data is not json encodable: {mod_save_data}")
 
-    str_save_data = json.dumps(json_save_data)
-    lockout_list.emplace_struct(
-        LockoutDefName=str_save_data,
-        DlcPackageId=_PACKAGE_ID,
-    )
+    str_save_data = _JSON_ENCODER.encode(json_save_data)
+    if existing_entry is None:
+        lockout_list.emplace_struct(
+            LockoutDefName=str_save_data,
+            DlcPackageId=_PACKAGE_ID,
+        )
+    else:
+        existing_entry.LockoutDefName = str_save_data
 
     # Reset our var tracking whether any options have changed since last save.
-    save_options.options.any_option_changed = False
+    option_change_flag.is_set = False
 
 
 @hook("WillowGame.WillowPlayerController:LoadGame", immediately_enable=True)
@@ -142,7 +163,7 @@ def end_load_game(_1: UObject, _2: WrappedStruct, ret: Any, _4: BoundFunction) -
     save_game = ret
     if not save_game:
         return
-    extracted_save_data = _extract_save_data(save_game.UnloadableDlcLockoutList)
+    extracted_save_data, _ = _extract_save_data(save_game.UnloadableDlcLockoutList)
     if not extracted_save_data:
         return
 
@@ -157,7 +178,7 @@ def end_load_game(_1: UObject, _2: WrappedStruct, ret: Any, _4: BoundFunction) -
 
     # Resetting change tracking var here too. Obviously a load sets a bunch of options, but we don't
     # want to count that as a real change that needs to be saved.
-    save_options.options.any_option_changed = False
+    option_change_flag.is_set = False
 
 
 @hook(
@@ -170,10 +191,8 @@ def load_player_save_game(*_: Any) -> None:  # noqa: D103
     # map. We use it to run callbacks, with the intent that any save data a mod wants to apply to
     # the player can be done here. At this point, save options have already been populated with
     # data from the save file through the EndLoadGame hook.
-    enabled_mods = [mod_id for mod_id, mod in registered_mods.items() if mod.is_enabled]
-
     for mod_id, callback in load_callbacks.items():
-        if mod_id in enabled_mods:
+        if registered_mods[mod_id].is_enabled:
             callback()
 
 
@@ -184,7 +203,7 @@ def hide_options_movie(*_: Any) -> None:  # noqa: D103
     # changed while in the main menu would get overwritten or just get lost if a new character were
     # selected.
 
-    if not save_options.options.any_option_changed:
+    if not option_change_flag.is_set:
         return
 
     trigger_save()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from unrealsdk import make_struct
 from unrealsdk.hooks import Type, prevent_hooking_direct_calls
@@ -17,7 +17,23 @@ from mods_base import (
 )
 from mods_base.options import BaseOption, DropdownOption, GroupedOption, KeybindOption, NestedOption
 
-any_option_changed: bool = False
+if TYPE_CHECKING:
+    from unrealsdk.unreal import UObject
+
+
+class _ChangeFlag:
+    """Tracks whether any save option has changed since the last time the game was saved."""
+
+    __slots__ = ("is_set",)
+
+    is_set: bool
+
+    def __init__(self) -> None:
+        self.is_set = False
+
+
+# Mutated in place rather than rebound, so setting it doesn't need a global store
+option_change_flag = _ChangeFlag()
 
 
 def set_option_to_default(save_option: BaseOption) -> None:
@@ -47,6 +63,29 @@ def can_save() -> bool:
     return cached_save and cached_save.SaveGameId != -1
 
 
+# Loading the save game is an async operation, we need to hook OnLoadComplete to have access to the
+# result. Enabled by `trigger_save` only while it's waiting on a load.
+@hook("WillowGame.WillowSaveGameManager:OnLoadComplete", Type.POST)  # not auto enabled
+def on_load_complete(save_manager: UObject, *_: Any) -> None:  # noqa: D103
+    on_load_complete.disable()
+    setattr(save_manager, "__OnLoadComplete__Delegate", None)
+
+    pc = get_pc()
+    # Need to prevent our hook on EndLoadGame to avoid reloading previous save option values
+    with prevent_hooking_direct_calls():
+        player_save_game, _ = save_manager.EndLoadGame(
+            pc.GetMyControllerId(),
+            make_struct("LoadInfo"),
+            0,
+        )
+    save_manager.SaveGame(
+        pc.GetMyControllerId(),
+        player_save_game,
+        save_manager.LastLoadedFilePath,
+        -1,
+    )
+
+
 def trigger_save() -> None:
     """
     Trigger a save game that stores our current save option values.
@@ -69,30 +108,7 @@ def trigger_save() -> None:
     save_manager = pc.GetWillowGlobals().GetWillowSaveGameManager()
     setattr(save_manager, "__OnLoadComplete__Delegate", save_manager.OnLoadComplete)
 
-    # Loading the save game is an async operation, we need to hook OnLoadComplete to have access
-    # to the result
-    @hook(
-        "WillowGame.WillowSaveGameManager:OnLoadComplete",
-        Type.POST,
-        immediately_enable=True,
-    )
-    def on_load_complete(*_: Any) -> None:
-        on_load_complete.disable()
-        setattr(save_manager, "__OnLoadComplete__Delegate", None)
-        # Need to prevent our hook on EndLoadGame to avoid reloading previous save option values
-        with prevent_hooking_direct_calls():
-            player_save_game, _ = save_manager.EndLoadGame(
-                pc.GetMyControllerId(),
-                make_struct("LoadInfo"),
-                0,
-            )
-        save_manager.SaveGame(
-            pc.GetMyControllerId(),
-            player_save_game,
-            save_manager.LastLoadedFilePath,
-            -1,
-        )
-
+    on_load_complete.enable()
     save_manager.BeginLoadGame(pc.GetMyControllerId(), save_manager.LastLoadedFilePath, -1)
 
 
@@ -141,6 +157,13 @@ class SaveOption(metaclass=SaveOptionMeta):
         class MySaveOption(SaveOption, SliderOption): ...
     """
 
+    # Shadowed by an instance attribute once __post_init__ has run
+    _is_initialized: ClassVar[bool] = False
+
+    def __post_init__(self) -> None:
+        super().__post_init__()  # type: ignore
+        object.__setattr__(self, "_is_initialized", True)
+
     def __setattr__(self, name: str, value: Any) -> None:
         # Overriding __setattr__ from ValueOption so that we can set our var to tell if a value
         # has been changed, which is then used to save the file when we leave the options menu.
@@ -149,10 +172,12 @@ class SaveOption(metaclass=SaveOptionMeta):
         # we're paired with ValueOption
         super().__setattr__(name, value)
 
-        # We're editing this var to track if an option has changed since the last time the game
-        # was saved. Saving when the menu closes instead of on change of each item.
-        global any_option_changed
-        any_option_changed = True
+        # We're setting this flag to track if an option has changed since the last time the game
+        # was saved. Saving when the menu closes instead of on change of each item. Writes made
+        # while constructing the option aren't real changes, so are ignored. Bypassing our
+        # __getattribute__, no need to check if we can save just to read this.
+        if object.__getattribute__(self, "_is_initialized"):
+            option_change_flag.is_set = True
 
     def __getattribute__(self, item: str) -> Any:
         # The __class__ variable is whatever the main class in most cases, and a ButtonOption
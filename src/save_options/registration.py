@@ -1,5 +1,6 @@
 import contextlib
 import inspect
+import sys
 import warnings
 from collections.abc import Callable, Sequence
 from pathlib import Path
@@ -22,8 +23,11 @@ registered_mods: dict[str, Mod] = {}
 
 _WARNING_SKIPS: tuple[str] = (str(Path(__file__).parent),)
 
+# Plain tuple rather than a union, so isinstance doesn't need to build one each call
+_GROUP_TYPES: tuple[type[GroupedOption], type[NestedOption]] = (GroupedOption, NestedOption)
 
-def _treat_as_save_option(obj: Any) -> bool:
+
+def _treat_as_save_option(obj: Any, cache: dict[int, bool] | None = None) -> bool:
     """
     Determines whether an object should be treated as a save option.
 
@@ -37,6 +41,8 @@ def _treat_as_save_option(obj: Any) -> bool:
 
     Args:
         obj: The object to evaluate.
+        cache: If not None, a dict of previous results for composite options, keyed by their id.
+               Only valid while the options it was filled from are alive.
 
     Returns:
         bool: True if the object or its children should be treated as SaveOption, False otherwise.
@@ -44,17 +50,33 @@ def _treat_as_save_option(obj: Any) -> bool:
 
     if isinstance(obj, SaveOption):
         return True
-    if isinstance(obj, GroupedOption | NestedOption):
-        if all(_treat_as_save_option(child) for child in obj.children):
-            return True
-        if any(_treat_as_save_option(child) for child in obj.children):
+    if not isinstance(obj, _GROUP_TYPES):
+        return False
+
+    if cache is not None and (cached := cache.get(id(obj))) is not None:
+        return cached
+
+    # Walk the children only once, stopping as soon as we know it's a partial mix
+    has_save_child = False
+    has_regular_child = False
+    for child in obj.children:
+        if _treat_as_save_option(child, cache):
+            has_save_child = True
+        else:
+            has_regular_child = True
+        if has_save_child and has_regular_child:
             warnings.warn(
                 f"Option {obj.identifier} has both regular BaseOption and SaveOption"
                 f" defined as children. SaveOption instances will be ignored.",
                 stacklevel=2,
                 skip_file_prefixes=_WARNING_SKIPS,
             )
-    return False
+            break
+
+    result = not has_regular_child
+    if cache is not None:
+        cache[id(obj)] = result
+    return result
 
 
 def register_save_options(  # noqa: C901, D417
@@ -93,7 +115,12 @@ def register_save_options(  # noqa: C901, D417
     """
 
     # Get calling module and identifier
-    module = inspect.getmodule(inspect.stack()[1].frame)
+    # Only grabbing the one frame we need, inspect.stack() builds source context for every frame on
+    # the stack. Looking the module up by name is a single dict lookup, only fall back to
+    # inspect.getmodule's full search if that fails.
+    frame = sys._getframe(1)  # pyright: ignore[reportPrivateUsage]
+    module = sys.modules.get(frame.f_globals.get("__name__", "")) or inspect.getmodule(frame)
+    del frame
     if module is None:
         raise ValueError("Unable to find calling module when registering save options!")
 
@@ -104,12 +131,17 @@ def register_save_options(  # noqa: C901, D417
     # when it's time to call the callbacks.
     registered_mods[mod_identifier] = mod
 
-    new_save_options: list[BaseOption] = []
+    # Only used for the duration of this call, so the ids stay valid
+    save_option_cache: dict[int, bool] = {}
+
+    # Writing straight into the final dict, keyed by identifier. As before, if multiple options
+    # share an identifier, the last one wins.
+    mod_save_options: ModSaveOptions = {}
     # Use save_options if provided, otherwise do a module search.
     if save_options is not None:
         for option in save_options:
-            if _treat_as_save_option(option):
-                new_save_options.append(option)
+            if _treat_as_save_option(option, save_option_cache):
+                mod_save_options[option.identifier] = option
             else:
                 warnings.warn(
                     f"Cannot register {option} as a SaveOption",
@@ -117,20 +149,21 @@ def register_save_options(  # noqa: C901, D417
                     skip_file_prefixes=_WARNING_SKIPS,
                 )
     else:
-        for _, value in inspect.getmembers(module):
-            if isinstance(value, GroupedOption | NestedOption):
+        # Going through the module dict directly, rather than inspect.getmembers, avoids sorting
+        # and running getattr on every name. Still need to copy it first, warning against the
+        # module can add `__warningregistry__` to it mid-loop.
+        for value in list(vars(module).values()):
+            if isinstance(value, _GROUP_TYPES):
                 warnings.warn(
                     f"{type(value).__name__} instances must be explicitly specified in the options"
                     f" list!",
                     stacklevel=2,
                     skip_file_prefixes=_WARNING_SKIPS,
                 )
-            elif _treat_as_save_option(value):
-                new_save_options.append(value)
+            elif _treat_as_save_option(value, save_option_cache):
+                mod_save_options[value.identifier] = value
 
-    registered_save_options[mod_identifier] = {
-        save_opt.identifier: save_opt for save_opt in new_save_options
-    }
+    registered_save_options[mod_identifier] = mod_save_options
 
     # Register on_save callback. Module search if not given as an arg.
     if on_save is None:
@@ -8,6 +8,13 @@ from mods_base import get_pc
 if TYPE_CHECKING:
     from types import EllipsisType
 
+# The default object is permanent, so only look it up the once. The time format itself is a setting
+# which may change, so it still needs to be read each time.
+_SAVE_GAME_MANAGER_DEFAULT = unrealsdk.find_class("WillowSaveGameManager").ClassDefaultObject
+
+_TIMESTAMP_FORMAT_12H = "[%I:%M:%S%p]"
+_TIMESTAMP_FORMAT_24H = "[%H:%M:%S]"
+
 
 def show_chat_message(
     message: str,
@@ -38,8 +45,10 @@ def show_chat_message(
         timestamp = datetime.now()  # noqa: DTZ005 - explicitly want local
 
     if timestamp is not None:
-        is12h = unrealsdk.find_class("WillowSaveGameManager").ClassDefaultObject.TimeFormat == "12"
-        time_str = timestamp.strftime("[%I:%M:%S%p]" if is12h else "[%H:%M:%S]").lower()
+        is12h = _SAVE_GAME_MANAGER_DEFAULT.TimeFormat == "12"
+        time_str = timestamp.strftime(
+            _TIMESTAMP_FORMAT_12H if is12h else _TIMESTAMP_FORMAT_24H,
+        ).lower()
         user = f"{user} {time_str}"
 
     pc.GetTextChatMovie().AddChatMessageInternal(user, message)
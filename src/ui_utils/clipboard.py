@@ -46,23 +46,28 @@ def clipboard_copy(contents: str) -> None:
         contents: The contents to copy.
     """
     if OpenClipboard(None):
-        EmptyClipboard()
-
-        # Don't need to do anything more if we have an empty string
-        if contents:
-            data = contents.encode("utf-16le") + b"\0\0"
-            size = len(data)
-
-            handle = GlobalAlloc(GMEM_MOVEABLE, size)
-            if handle:
-                locked_handle = GlobalLock(handle)
-                if locked_handle:
-                    ct.memmove(locked_handle, data, size)
-                    GlobalUnlock(handle)
-
-                    SetClipboardData(CF_UNICODETEXT, handle)
-
-        CloseClipboard()
+        try:
+            EmptyClipboard()
+
+            # Don't need to do anything more if we have an empty string
+            if contents:
+                # Windows wchars are UTF-16, so this gives us the null terminated clipboard format
+                # in a single allocation, no need to encode and then append the terminator
+                data = ct.create_unicode_buffer(contents)
+                size = ct.sizeof(data)
+
+                handle = GlobalAlloc(GMEM_MOVEABLE, size)
+                if handle:
+                    locked_handle = GlobalLock(handle)
+                    if locked_handle:
+                        try:
+                            ct.memmove(locked_handle, data, size)
+                        finally:
+                            GlobalUnlock(handle)
+
+                        SetClipboardData(CF_UNICODETEXT, handle)
+        finally:
+            CloseClipboard()
 
 
 def clipboard_paste() -> str | None:
@@ -75,14 +80,18 @@ def clipboard_paste() -> str | None:
     contents: str | None = None
 
     if OpenClipboard(None):
-        handle = GetClipboardData(CF_UNICODETEXT)
-        if handle:
-            locked_handle = GlobalLock(handle)
-            if locked_handle:
-                contents = ct.wstring_at(locked_handle)
-
-            GlobalUnlock(handle)
-
-        CloseClipboard()
+        try:
+            handle = GetClipboardData(CF_UNICODETEXT)
+            if handle:
+                # Only need to unlock if the lock actually succeeded
+                locked_handle = GlobalLock(handle)
+                if locked_handle:
+                    try:
+                        contents = ct.wstring_at(locked_handle)
+                    finally:
+                        GlobalUnlock(handle)
+        finally:
+            # Make sure we never leave the clipboard open for every other program
+            CloseClipboard()
 
     return contents
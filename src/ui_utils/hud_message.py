@@ -29,6 +29,12 @@ __all__: tuple[str, ...] = (
     "show_second_wind_notification",
 )
 
+# Only ever passed by value, so a single instance can be shared between calls
+_DEFAULT_COLOR = unrealsdk.make_struct("Color")
+
+# Indexed by ERewardPopup value
+_REWARD_POPUP_ICONS: tuple[str, ...] = ("token", "head", "playerSkin", "vehicleSkin")
+
 
 def show_hud_message(title: str, msg: str, duration: float = 2.5) -> None:
     """
@@ -56,7 +62,7 @@ def show_hud_message(title: str, msg: str, duration: float = 2.5) -> None:
         msg,
         title,
         duration,
-        unrealsdk.make_struct("Color"),
+        _DEFAULT_COLOR,
         "",
         False,
         0,
@@ -87,14 +93,19 @@ def show_second_wind_notification(
 
     sound_backup = None
     sw_interaction = None
-    for interaction in hud_movie.InteractionOverrideSounds:
-        if interaction.Interaction == "SecondWind":
-            sound_backup = interaction.AkEvent
-            sw_interaction = interaction
-            break
-
-    if ui_sound is not Ellipsis and sw_interaction:
-        sw_interaction.AkEvent = ui_sound
+    # Only need to go looking for the sound override if we're actually replacing it
+    if ui_sound is not Ellipsis:
+        sw_interaction = next(
+            (
+                interaction
+                for interaction in hud_movie.InteractionOverrideSounds
+                if interaction.Interaction == "SecondWind"
+            ),
+            None,
+        )
+        if sw_interaction:
+            sound_backup = sw_interaction.AkEvent
+            sw_interaction.AkEvent = ui_sound
 
     backup_string = hud_movie.SecondWindString
     hud_movie.SecondWindString = msg
@@ -137,12 +148,11 @@ def show_reward_popup(
     if (hud_movie := get_pc().GetHUDMovie()) is None:
         return
 
-    icon = {
-        ERewardPopup.ERP_BadassToken: "token",
-        ERewardPopup.ERP_CharacterHead: "head",
-        ERewardPopup.ERP_CharacterSkin: "playerSkin",
-        ERewardPopup.ERP_VehicleSkin: "vehicleSkin",
-    }.get(reward_type, "token")
+    icon = (
+        _REWARD_POPUP_ICONS[reward_type]
+        if 0 <= reward_type < len(_REWARD_POPUP_ICONS)
+        else _REWARD_POPUP_ICONS[ERewardPopup.ERP_BadassToken]
+    )
 
     hud_movie.SingleArgInvokeS("p1.badassToken.gotoAndStop", "stop")
     hud_movie.SingleArgInvokeS("p1.badassToken.gotoAndStop", "go")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import warnings
 from dataclasses import KW_ONLY, dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, ClassVar, Self
 
 from unrealsdk.hooks import Block
@@ -19,6 +20,23 @@ __all__: tuple[str, ...] = (
     "Page",
 )
 
+# Tags for each button index, extended as needed
+_button_tags: list[str] = []
+
+
+def _get_button_tag(idx: int) -> str:
+    """
+    Gets the tag to give an option box button, based on its index.
+
+    Args:
+        idx: The index of the button on its page.
+    Returns:
+        The button's tag.
+    """
+    while len(_button_tags) <= idx:
+        _button_tags.append(f"ui_utils:button:{len(_button_tags)}")
+    return _button_tags[idx]
+
 
 @dataclass
 class OptionBoxButton:
@@ -58,6 +76,7 @@ class OptionBox:
     """
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def create_tooltip_string(enter_message: str = "Select", esc_message: str = "Cancel") -> str:
         """
         Creates a tooltip string in the same format the game uses, but with custom messages.
@@ -90,6 +109,15 @@ class OptionBox:
 
     _pages: list[Page] = field(init=False, repr=False, default_factory=list["Page"])
     _current_page_idx: int = field(init=False, repr=False, default=0)
+    # The last set of pages we created, and the settings they were created from
+    _cached_pages: list[Page] = field(init=False, repr=False, default_factory=list["Page"])
+    _cached_pages_key: tuple[Any, ...] | None = field(init=False, repr=False, default=None)
+    # The first and last non-paging buttons on each page
+    _page_edge_buttons: list[tuple[OptionBoxButton, OptionBoxButton]] = field(
+        init=False,
+        repr=False,
+        default_factory=list[tuple[OptionBoxButton, OptionBoxButton]],
+    )
 
     # While we don't display previous page, defining one for use in subclasses
     _next_page: ClassVar[OptionBoxButton] = OptionBoxButton("Next Page")
@@ -110,7 +138,33 @@ class OptionBox:
         if self.is_showing():
             self.hide()
 
-        self._create_pages()
+        # Creating pages is relatively expensive, since they each need to bind their hooks, so reuse
+        # the last set if nothing's changed since. Since the cached pages keep the buttons alive,
+        # their ids can't have been reused.
+        pages_key = (
+            tuple(map(id, self.buttons)),
+            self.title,
+            self.message,
+            self.tooltip,
+            self.prevent_cancelling,
+            self.priority,
+        )
+        if pages_key != self._cached_pages_key:
+            self._create_pages()
+            self._cached_pages = self._pages
+            self._cached_pages_key = pages_key
+
+            # Work these out once per set of pages, rather than on every page change
+            paging_buttons = (self._next_page, self._prev_page)
+            self._page_edge_buttons.clear()
+            for page in self._pages:
+                normal_buttons = [
+                    page_button for page_button in page.buttons if page_button not in paging_buttons
+                ]
+                self._page_edge_buttons.append((normal_buttons[0], normal_buttons[-1]))
+
+        # We clear _pages to mark that we're no longer showing, so use a copy of the cached list
+        self._pages = self._cached_pages.copy()
         self._current_page_idx = 0
 
         for idx, page in enumerate(self._pages):
@@ -183,11 +237,8 @@ class OptionBox:
         Returns:
             The first button.
         """
-        return next(
-            button
-            for button in self._pages[self._current_page_idx].buttons[:: 1 if first else -1]
-            if button not in (self._next_page, self._prev_page)
-        )
+        first_button, last_button = self._page_edge_buttons[self._current_page_idx]
+        return first_button if first else last_button
 
     def _hide_page(self) -> None:
         """Hides the current page if it is showing."""
@@ -209,31 +260,27 @@ class OptionBox:
 
     def _page_up(self) -> None:
         """Moves to the previous page."""
-        self._hide_page()
-        self._current_page_idx = (self._current_page_idx - 1) % len(self._pages)
-
         if len(self._pages) == 1:
             # If there's only a single page, select the first item on it
-            button = self._get_page_edge_button(first=True)
-        else:
-            # Otherwise, select the last item on the previous page
-            button = self._get_page_edge_button(first=False)
+            self._home()
+            return
 
-        self._pages[self._current_page_idx].show(button)
+        # Otherwise, select the last item on the previous page
+        self._hide_page()
+        self._current_page_idx = (self._current_page_idx - 1) % len(self._pages)
+        self._pages[self._current_page_idx].show(self._get_page_edge_button(first=False))
 
     def _page_down(self) -> None:
         """Moves to the next page."""
-        self._hide_page()
-        self._current_page_idx = (self._current_page_idx + 1) % len(self._pages)
-
         if len(self._pages) == 1:
             # If there's only a single page, select the last item on it
-            button = self._get_page_edge_button(first=False)
-        else:
-            # Otherwise, select the first item on the next page
-            button = self._get_page_edge_button(first=True)
+            self._end()
+            return
 
-        self._pages[self._current_page_idx].show(button)
+        # Otherwise, select the first item on the next page
+        self._hide_page()
+        self._current_page_idx = (self._current_page_idx + 1) % len(self._pages)
+        self._pages[self._current_page_idx].show(self._get_page_edge_button(first=True))
 
     def _paging_on_select(self, _: Page, button: OptionBoxButton) -> None:
         """Selection handler for the paging system."""
@@ -253,6 +300,19 @@ class OptionBox:
         if self.on_cancel is not None:
             self.on_cancel(self)
 
+    # Inputs which always page, regardless of what's selected, and the name of the method handling
+    # each. Looked up by name so that subclasses may override them.
+    _PAGING_INPUT_HANDLERS: ClassVar[dict[tuple[str, EInputEvent], str]] = {
+        ("PageUp", EInputEvent.IE_Pressed): "_page_up",
+        ("XboxTypeS_LeftTrigger", EInputEvent.IE_Pressed): "_page_up",
+        ("PageDown", EInputEvent.IE_Pressed): "_page_down",
+        ("XboxTypeS_RightTrigger", EInputEvent.IE_Pressed): "_page_down",
+        ("Home", EInputEvent.IE_Pressed): "_home",
+        ("End", EInputEvent.IE_Pressed): "_end",
+    }
+    _UP_KEYS: ClassVar[frozenset[str]] = frozenset(("Up", "Gamepad_LeftStick_Up"))
+    _DOWN_KEYS: ClassVar[frozenset[str]] = frozenset(("Down", "Gamepad_LeftStick_Down"))
+
     def _paging_on_input(
         self,
         _: Page,
@@ -260,38 +320,25 @@ class OptionBox:
         event: EInputEvent,
     ) -> Block | type[Block] | None:
         """Input handler for the paging system."""
-        match key, event:
-            case "PageUp" | "XboxTypeS_LeftTrigger", EInputEvent.IE_Pressed:
-                self._page_up()
-                return Block
-            case "PageDown" | "XboxTypeS_RightTrigger", EInputEvent.IE_Pressed:
-                self._page_down()
-                return Block
-            case "Home", EInputEvent.IE_Pressed:
-                self._home()
-                return Block
-            case "End", EInputEvent.IE_Pressed:
-                self._end()
-                return Block
-
-            case (
-                "Up" | "Gamepad_LeftStick_Up",
-                EInputEvent.IE_Pressed,
-            ) if self.get_selected_button() == self._prev_page:
-                self._page_up()
-                return Block
-
-            case (
-                "Down" | "Gamepad_LeftStick_Down",
-                EInputEvent.IE_Pressed,
-            ) if self.get_selected_button() == self._next_page:
-                self._page_down()
-                return Block
-
-            case _, _:
-                if self.on_input is not None:
-                    return self.on_input(self, key, event)
-                return None
+        if (handler_name := self._PAGING_INPUT_HANDLERS.get((key, event))) is not None:
+            getattr(self, handler_name)()
+            return Block
+
+        if event == EInputEvent.IE_Pressed:
+            is_up = key in self._UP_KEYS
+            if is_up or key in self._DOWN_KEYS:
+                # We only get inputs while a page is showing, so can skip straight to it
+                selected = self._pages[self._current_page_idx].get_selected_button()
+                if is_up and selected == self._prev_page:
+                    self._page_up()
+                    return Block
+                if not is_up and selected == self._next_page:
+                    self._page_down()
+                    return Block
+
+        if self.on_input is not None:
+            return self.on_input(self, key, event)
+        return None
 
 
 @dataclass
@@ -368,9 +415,9 @@ class Page:
 
         # We give each button a tag based on index so that you can add two with the same name
         for idx, button_to_draw in enumerate(self.buttons):
-            dialog.AppendButton(f"ui_utils:button:{idx}", button_to_draw.name, button_to_draw.tip)
+            dialog.AppendButton(_get_button_tag(idx), button_to_draw.name, button_to_draw.tip)
 
-        dialog.SetDefaultButton(f"ui_utils:button:{button_idx}", True)
+        dialog.SetDefaultButton(_get_button_tag(button_idx), True)
         dialog.ApplyLayout()
         self._gfx_object = WeakPointer(dialog)
 
@@ -440,7 +487,9 @@ class Page:
             self._disable_hooks()
             return False
 
-        return obj == dialog
+        # UObjects don't override equality, and the sdk always hands out the same python object for
+        # the same unreal object, so this is just an identity check - do it directly
+        return obj is dialog
 
     @hook("WillowGame.WillowGFxDialogBox:HandleInputKey")
     def _option_box_input_key(
@@ -450,15 +499,15 @@ class Page:
         _3: Any,
         _4: BoundFunction,
     ) -> Block | type[Block] | None:
+        # Without an input callback there's nothing to do, whichever dialog this is
+        if self.on_input is None:
+            return None
         if not self._is_correct_option_box(obj):
             return None
 
-        if self.on_input is not None:
-            key: str = args.ukey
-            event: EInputEvent = args.uevent
-            return self.on_input(self, key, event)
-
-        return None
+        key: str = args.ukey
+        event: EInputEvent = args.uevent
+        return self.on_input(self, key, event)
 
     @hook("WillowGame.WillowGFxDialogBox:Accepted")
     def _option_box_accepted(
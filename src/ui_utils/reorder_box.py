@@ -1,6 +1,7 @@
 import warnings
 from dataclasses import KW_ONLY, dataclass, field
-from typing import TYPE_CHECKING, Any, Literal, Self
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, NamedTuple, Self
 
 from unrealsdk.hooks import Block
 
@@ -12,6 +13,13 @@ if TYPE_CHECKING:
     from collections.abc import Callable, MutableSequence
 
 
+class _PageJumps(NamedTuple):
+    page_up: int
+    page_down: int
+    home: int
+    end: int
+
+
 @dataclass
 class ReorderBox(OptionBox):
     """
@@ -38,6 +46,7 @@ class ReorderBox(OptionBox):
     """
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def create_tooltip_string(
         enter_message: str = "Select",
         esc_message: str = "Cancel",
@@ -71,6 +80,14 @@ class ReorderBox(OptionBox):
     on_move: Callable[[Self, OptionBoxButton], None] | None = None
 
     _is_currently_moving: bool = field(init=False, repr=False, default=False)
+    # Maps the id of each button to it's index, rebuilt alongside the pages
+    _button_indexes: dict[int, int] = field(init=False, repr=False, default_factory=dict[int, int])
+    # Which button index each paging input should move to, per page
+    _page_jumps: list[_PageJumps] = field(
+        init=False,
+        repr=False,
+        default_factory=list[_PageJumps],
+    )
 
     # Stub properties from parent class
 
@@ -122,27 +139,63 @@ class ReorderBox(OptionBox):
             "on_cancel": self._paging_on_cancel,
         }
 
+        # Buttons may compare equal to each other, so need to go by identity
+        self._button_indexes = {id(button): idx for idx, button in enumerate(self.buttons)}
+
         if len(self.buttons) <= 5:  # noqa: PLR2004
             self._pages = [Page(buttons=self.buttons, **kwargs)]
         else:
+            num_buttons = len(self.buttons)
+
             # First page has 4 normal buttons and the next button
-            button_groups = [[*self.buttons[:4], self._next_page]]
+            self._pages = [Page(buttons=[*self.buttons[:4], self._next_page], **kwargs)]
 
             # Fill in all other pages with 3 normal buttons and next + previous
-            button_groups += [
-                [self._prev_page, *self.buttons[i : i + 3], self._next_page]
-                for i in range(4, len(self.buttons), 3)
-            ]
-            # Remove the next page button from the last page
-            button_groups[-1].pop()
-
-            # If a single normal button got left on the last page, move it back to the previous page
-            # replacing it's next page button
-            if len(button_groups[-1]) == 2:  # noqa: PLR2004
-                button_groups[-2][-1] = button_groups[-1][1]
-                button_groups.pop()
-
-            self._pages = [Page(buttons=group, **kwargs) for group in button_groups]
+            start = 4
+            while start < num_buttons:
+                end = start + 3
+                # If this would leave a single normal button for the last page, put it on this page
+                # instead of the next page button
+                if end == num_buttons - 1:
+                    end = num_buttons
+
+                group = [self._prev_page, *self.buttons[start:end]]
+                # The last page has no next page button
+                if end < num_buttons:
+                    group.append(self._next_page)
+
+                self._pages.append(Page(buttons=group, **kwargs))
+                start = end
+
+        # These are constant until the next time we create pages, so work them all out now, rather
+        # than on every input
+        num_pages = len(self._pages)
+        last_idx = len(self.buttons) - 1
+        self._page_jumps = [
+            _PageJumps(
+                # On page 1, return 3 (last in page 0)
+                # On page n, return 3 after what page n-1 returned
+                # F(n) = 3n
+                # On page 0, return 0 - which fits in the formula already
+                page_up=3 * page_idx,
+                # On page 0, return 4 (first in page 1)
+                # On page n, return 3 after what page n-1 returned
+                # F(n) = 3n + 4
+                # On the last page, return the last index
+                page_down=last_idx if page_idx == num_pages - 1 else (3 * page_idx) + 4,
+                # On page 1, return 4 (first in page 1)
+                # On page n, return 3 after what page n-1 returned
+                # F(n) = 3n + 1
+                # On page 0, return 0
+                home=0 if page_idx == 0 else (3 * page_idx) + 1,
+                # On page 0, return 3 (last in page 0)
+                # On page n, return 3 after what page n-1 returned
+                # F(n) = 3(n + 1)
+                # On the last page, return the last index
+                end=last_idx if page_idx == num_pages - 1 else 3 * (page_idx + 1),
+            )
+            for page_idx in range(num_pages)
+        ]
 
     def _paging_on_select(self, _: Page, button: OptionBoxButton) -> None:
         if self._is_currently_moving:
@@ -157,61 +210,60 @@ class ReorderBox(OptionBox):
 
         self.show(button)
 
-    def _paging_on_input(  # noqa: C901
+    def _move_up_index(self, current_index: int) -> int:
+        return max(current_index - 1, 0)
+
+    def _move_down_index(self, current_index: int) -> int:
+        return min(current_index + 1, len(self.buttons) - 1)
+
+    def _page_up_index(self, _: int) -> int:
+        return self._page_jumps[self._current_page_idx].page_up
+
+    def _page_down_index(self, _: int) -> int:
+        return self._page_jumps[self._current_page_idx].page_down
+
+    def _home_index(self, _: int) -> int:
+        return self._page_jumps[self._current_page_idx].home
+
+    def _end_index(self, _: int) -> int:
+        return self._page_jumps[self._current_page_idx].end
+
+    # Maps each input we handle to the name of the method which works out which index to move to.
+    # Stored by name rather than as functions, so that subclasses may override them.
+    _MOVE_HANDLERS: ClassVar[dict[tuple[str, EInputEvent], str]] = {
+        ("Up", EInputEvent.IE_Pressed): "_move_up_index",
+        ("Gamepad_LeftStick_Up", EInputEvent.IE_Pressed): "_move_up_index",
+        ("Down", EInputEvent.IE_Pressed): "_move_down_index",
+        ("Gamepad_LeftStick_Down", EInputEvent.IE_Pressed): "_move_down_index",
+        ("PageUp", EInputEvent.IE_Pressed): "_page_up_index",
+        ("XboxTypeS_LeftTrigger", EInputEvent.IE_Pressed): "_page_up_index",
+        ("PageDown", EInputEvent.IE_Pressed): "_page_down_index",
+        ("XboxTypeS_RightTrigger", EInputEvent.IE_Pressed): "_page_down_index",
+        ("Home", EInputEvent.IE_Pressed): "_home_index",
+        ("End", EInputEvent.IE_Pressed): "_end_index",
+    }
+
+    def _paging_on_input(
         self,
         _: Page,
         key: str,
         event: EInputEvent,
     ) -> Block | type[Block] | None:
-        current_index = self.buttons.index(self.get_selected_button())
-        new_index: int
-
-        match key, event:
-            case "Up" | "Gamepad_LeftStick_Up", EInputEvent.IE_Pressed:
-                new_index = max(current_index - 1, 0)
-            case "Down" | "Gamepad_LeftStick_Down", EInputEvent.IE_Pressed:
-                new_index = min(current_index + 1, len(self.buttons) - 1)
-
-            case "PageUp" | "XboxTypeS_LeftTrigger", EInputEvent.IE_Pressed:
-                # On page 1, return 3 (last in page 0)
-                # On page n, return 3 after what page n-1 returned
-                # F(n) = 3n
-                # On page 0, return 0 - which fits in the formula already
-                new_index = self._current_page_idx * 3
-
-            case "PageDown" | "XboxTypeS_RightTrigger", EInputEvent.IE_Pressed:
-                # On page 0, return 4 (first in page 1)
-                # On page n, return 3 after what page n-1 returned
-                # F(n) = 3n + 4
-                # On the last page, return the last index
-                new_index = (
-                    len(self.buttons) - 1
-                    if self._current_page_idx == (len(self._pages) - 1)
-                    else (3 * self._current_page_idx) + 4
-                )
-
-            case "Home", EInputEvent.IE_Pressed:
-                # On page 1, return 4 (first in page 1)
-                # On page n, return 3 after what page n-1 returned
-                # F(n) = 3n + 1
-                # On page 0, return 0
-                new_index = 0 if self._current_page_idx == 0 else (3 * self._current_page_idx) + 1
+        handler_name = self._MOVE_HANDLERS.get((key, event))
+
+        # If the selection is on a paging button (e.g. if moved there via mouse), there's nothing
+        # for us to move, treat it like any other input
+        current_index = (
+            None
+            if handler_name is None
+            else self._button_indexes.get(id(self.get_selected_button()))
+        )
+        if handler_name is None or current_index is None:
+            if self.on_input is not None:
+                return self.on_input(self, key, event)
+            return None
 
-            case "End", EInputEvent.IE_Pressed:
-                # On page 0, return 3 (last in page 0)
-                # On page n, return 3 after what page n-1 returned
-                # F(n) = 3(n + 1)
-                # On the last page, return the last index
-                new_index = (
-                    len(self.buttons) - 1
-                    if self._current_page_idx == (len(self._pages) - 1)
-                    else 3 * (self._current_page_idx + 1)
-                )
-
-            case _, _:
-                if self.on_input is not None:
-                    return self.on_input(self, key, event)
-                return None
+        new_index: int = getattr(self, handler_name)(current_index)
 
         if new_index != current_index:
             self.hide()
@@ -131,7 +131,8 @@ class TrainingBox:
             self._training_box_on_close.disable()
             return False
 
-        return obj == dialog
+        # There's only ever one python object per unreal object, so comparing identity is enough
+        return obj is dialog
 
     @hook("WillowGame.WillowGFxTrainingDialogBox:HandleInputKey")
     def _training_box_input_key(
@@ -141,15 +142,16 @@ class TrainingBox:
         _3: Any,
         _4: BoundFunction,
     ) -> Block | type[Block] | None:
-        if not self._is_correct_training_box(obj):
+        # This runs on every key press, if there's no callback there's no need to check anything
+        if self.on_input is None:
             return None
 
-        if self.on_input is not None:
-            key: str = args.ukey
-            event: EInputEvent = args.uevent
-            return self.on_input(self, key, event)
+        if not self._is_correct_training_box(obj):
+            return None
 
-        return None
+        key: str = args.ukey
+        event: EInputEvent = args.uevent
+        return self.on_input(self, key, event)
 
     @hook("WillowGame.WillowGFxTrainingDialogBox:OnClose")
     def _training_box_on_close(
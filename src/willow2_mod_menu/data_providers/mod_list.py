@@ -18,13 +18,16 @@ class ModListDataProvider(DataProvider):
     def populate(self, data_provider: UObject, the_list: UObject) -> None:  # noqa: D102
         del data_provider
 
-        mods = get_ordered_mod_list()
-        favourite_mods = [m for m in mods if is_favourite(m)]
-        non_favourite_mods = [m for m in mods if not is_favourite(m)]
+        # Split in a single pass, so we only check if each mod is a favourite once
+        favourite_mods: list[Mod] = []
+        non_favourite_mods: list[Mod] = []
+        for mod in get_ordered_mod_list():
+            (favourite_mods if is_favourite(mod) else non_favourite_mods).append(mod)
         self.drawn_mod_list = favourite_mods + non_favourite_mods
 
+        add_list_item = the_list.AddListItem
         for idx, mod in enumerate(self.drawn_mod_list):
-            the_list.AddListItem(idx, mod.name, False)
+            add_list_item(idx, mod.name, False)
 
     def populate_keybind_keys(self, data_provider: UObject) -> None:  # noqa: ARG002, D102
         return
@@ -38,6 +38,12 @@ RESET_KEYBINDS_DESC = "$WillowMenu.MenuOptionDisplayNames.ResetKeyBindsDesc"
 
 DUMMY_ACTION = "DUMMY"
 
+# The game's language can't change while it's running, so we only need to localize each key once
+_localized_key_names: dict[str, str] = {}
+
+# Every option gets checked against these while drawing the keybinds menu, so build the tuple once
+_GROUP_TYPES: tuple[type[GroupedOption], type[NestedOption]] = (GroupedOption, NestedOption)
+
 
 @dataclass
 class ModOptionsDataProvider(OptionsDataProvider):
@@ -49,6 +55,13 @@ class ModOptionsDataProvider(OptionsDataProvider):
         default_factory=dict[int, KeybindOption],
         repr=False,
     )
+    # Maps the id of each grouped/nested option to if it contains a visible keybind. Cleared at the
+    # start of each populate, since mods may hide or show keybinds between menu opens.
+    _keybind_visible_cache: dict[int, bool] = field(
+        default_factory=dict[int, bool],
+        init=False,
+        repr=False,
+    )
 
     def __post_init__(self) -> None:
         self.options = tuple(self.gen_options_list())
@@ -64,11 +77,21 @@ class ModOptionsDataProvider(OptionsDataProvider):
         # full thing, since just the option description is quite small
         on_press: Callable[[ButtonOption], None] | None = None
         if TrainingBox is not None:
-            full_description = TrainingBox(
-                title=self.mod.name,
-                message=get_mod_description(self.mod, True),
-            )
-            on_press = lambda _: full_description.show()  # noqa: E731
+            training_box_cls = TrainingBox
+            # Most of the time no one clicks it, so only create the box (and build the full
+            # description) on the first press
+            show_full_description: Callable[[], None] | None = None
+
+            def show_on_press(_: ButtonOption) -> None:
+                nonlocal show_full_description
+                if show_full_description is None:
+                    show_full_description = training_box_cls(
+                        title=self.mod.name,
+                        message=get_mod_description(self.mod, True),
+                    ).show
+                show_full_description()
+
+            on_press = show_on_press
 
         yield ButtonOption(
             "Description",
@@ -98,15 +121,40 @@ class ModOptionsDataProvider(OptionsDataProvider):
         Args:
             options: The list of options to check.
         """
-        return any(
-            (
-                isinstance(option, GroupedOption | NestedOption)
-                and not option.is_hidden
-                and ModOptionsDataProvider.any_keybind_visible(option.children)
-            )
-            or (isinstance(option, KeybindOption) and not option.is_hidden)
-            for option in options
-        )
+        for option in options:
+            if option.is_hidden:
+                continue
+            if isinstance(option, _GROUP_TYPES):
+                if ModOptionsDataProvider.any_keybind_visible(option.children):
+                    return True
+            elif isinstance(option, KeybindOption):
+                return True
+        return False
+
+    def is_keybind_visible(self, option: BaseOption) -> bool:
+        """
+        Checks if a single option is a visible keybind, or a group containing one.
+
+        Matches `any_keybind_visible`. Groups are cached, since `add_keybinds_list` needs to check
+        every group both when drawing it and when drawing the entries before it.
+
+        Args:
+            option: The option to check.
+        Returns:
+            True if the option is visible.
+        """
+        if option.is_hidden:
+            return False
+        if isinstance(option, KeybindOption):
+            return True
+        if not isinstance(option, _GROUP_TYPES):
+            return False
+
+        cached = self._keybind_visible_cache.get(id(option))
+        if cached is None:
+            cached = any(self.is_keybind_visible(child) for child in option.children)
+            self._keybind_visible_cache[id(option)] = cached
+        return cached
 
     def add_keybinds_list(
         self,
@@ -114,6 +162,7 @@ class ModOptionsDataProvider(OptionsDataProvider):
         options: Sequence[BaseOption],
         group_stack: list[GroupedOption | NestedOption],
         nest_idx: int = 0,
+        group_caption: str = "",
     ) -> None:
         """
         Adds a list of keybinds to the current menu.
@@ -123,62 +172,77 @@ class ModOptionsDataProvider(OptionsDataProvider):
             options: The list of options containing the keybinds to add.
             group_stack: The stack of currently open grouped options. Should start out empty.
             nest_idx: Incrementing counter for each nested list.
+            group_caption: The header caption for the current group stack. Should start out empty.
         """
         nest_depth = len(group_stack)
+        indent = "  " if group_stack else ""
+        # Every keybind and group header goes through this
+        add_key_bind_entry = data_provider.AddKeyBindEntry
+
+        # Post group headers are only drawn when nested, in which case we need to know if anything
+        # after each entry is visible. Work them all out at once, rather than re-scanning the rest
+        # of the list after every group.
+        visible_after: list[bool] = []
+        if group_stack:
+            visible_after = [False] * (len(options) + 1)
+            for idx in range(len(options) - 1, -1, -1):
+                visible_after[idx] = visible_after[idx + 1] or self.is_keybind_visible(options[idx])
 
         for options_idx, option in enumerate(options):
             if option.is_hidden:
                 continue
 
-            tag_this_idx = f"{nest_depth}:{nest_idx}:{options_idx}"
-
-            match option:
-                case KeybindOption():
-                    tag_prefix = KB_TAG_KEYBIND if option.is_rebindable else KB_TAG_UNREBINDABLE
-                    tag = f"{tag_prefix}:{tag_this_idx}"
-                    caption = ("  " if group_stack else "") + option.display_name
-
-                    keybind_idx = data_provider.AddKeyBindEntry(tag, DUMMY_ACTION, caption)
-                    self.drawn_keybinds[keybind_idx] = option
-
-                # This is the same sort of logic as grouped options in add_options_list
-                case GroupedOption() | NestedOption() if self.any_keybind_visible(option.children):
-                    group_stack.append(option)
-
-                    if len(option.children) == 0 or not (
-                        isinstance(option.children[0], GroupedOption | NestedOption)
-                    ):
-                        tag = f"{KB_TAG_HEADER}:{tag_this_idx}:pre_group"
-                        caption = " - ".join(g.display_name for g in group_stack)
-                        data_provider.AddKeyBindEntry(tag, DUMMY_ACTION, caption)
-
-                    nest_idx += 1
-                    self.add_keybinds_list(
-                        data_provider,
-                        option.children,
-                        group_stack,
-                        nest_idx,
-                    )
-
-                    group_stack.pop()
-
-                    if (
-                        group_stack
-                        and options_idx != len(options) - 1
-                        and self.any_keybind_visible(options[options_idx + 1 :])
-                        and not isinstance(options[options_idx + 1], GroupedOption | NestedOption)
-                    ):
-                        tag = f"{KB_TAG_HEADER}:{tag_this_idx}:post_group"
-                        caption = " - ".join(g.display_name for g in group_stack)
-                        data_provider.AddKeyBindEntry(tag, DUMMY_ACTION, caption)
-
-                case _:
-                    pass
+            # Only building tags for the options which actually get drawn
+            if isinstance(option, KeybindOption):
+                tag_prefix = KB_TAG_KEYBIND if option.is_rebindable else KB_TAG_UNREBINDABLE
+                tag = f"{tag_prefix}:{nest_depth}:{nest_idx}:{options_idx}"
+                caption = indent + option.display_name
+
+                keybind_idx = add_key_bind_entry(tag, DUMMY_ACTION, caption)
+                self.drawn_keybinds[keybind_idx] = option
+
+            # This is the same sort of logic as grouped options in add_options_list
+            elif isinstance(option, _GROUP_TYPES) and self.is_keybind_visible(option):
+                # Both headers use the index from before we increment it below
+                header_tag = f"{KB_TAG_HEADER}:{nest_depth}:{nest_idx}:{options_idx}"
+
+                # The caption we were passed already covers the rest of the stack
+                inner_caption = (
+                    f"{group_caption} - {option.display_name}"
+                    if group_stack
+                    else option.display_name
+                )
+                group_stack.append(option)
+
+                if len(option.children) == 0 or not isinstance(option.children[0], _GROUP_TYPES):
+                    tag = f"{header_tag}:pre_group"
+                    add_key_bind_entry(tag, DUMMY_ACTION, inner_caption)
+
+                nest_idx += 1
+                self.add_keybinds_list(
+                    data_provider,
+                    option.children,
+                    group_stack,
+                    nest_idx,
+                    inner_caption,
+                )
+
+                group_stack.pop()
+
+                if (
+                    group_stack
+                    and options_idx != len(options) - 1
+                    and visible_after[options_idx + 1]
+                    and not isinstance(options[options_idx + 1], _GROUP_TYPES)
+                ):
+                    tag = f"{header_tag}:post_group"
+                    add_key_bind_entry(tag, DUMMY_ACTION, group_caption)
 
     def populate(self, data_provider: UObject, the_list: UObject) -> None:  # noqa: D102
         super().populate(data_provider, the_list)
 
-        if not self.any_keybind_visible(self.options):
+        self._keybind_visible_cache.clear()
+        if not any(self.is_keybind_visible(option) for option in self.options):
             return
 
         the_list.AddListItem(KEYBINDS_EVENT_ID, KEYBINDS_NAME, False)
@@ -203,11 +267,14 @@ class ModOptionsDataProvider(OptionsDataProvider):
         localized_key: str
         if option.value is None:
             localized_key = ""
+        elif option.value in _localized_key_names:
+            localized_key = _localized_key_names[option.value]
         else:
             localized_key = data_provider.GetLocalizedKeyName(option.value)
             # If we failed to localize, just use the raw key name
             if localized_key.startswith("?INT?"):
                 localized_key = option.value
+            _localized_key_names[option.value] = localized_key
 
         if not option.is_rebindable:
             localized_key = f"[ {localized_key} ]"
@@ -218,14 +285,16 @@ class ModOptionsDataProvider(OptionsDataProvider):
         controller_mapping_clip = data_provider.ControllerMappingClip
         controller_mapping_clip.EmptyKeyData()
 
+        add_key_data = controller_mapping_clip.AddKeyData
         for idx, key in enumerate(data_provider.KeyBinds):
-            if idx not in self.drawn_keybinds:
+            option = self.drawn_keybinds.get(idx)
+            if option is None:
                 # Must be a group header, display without a key
-                key.Object = controller_mapping_clip.AddKeyData(key.Tag, key.Caption, "")
+                key.Object = add_key_data(key.Tag, key.Caption, "")
                 continue
 
-            localized_key = self.localize_keybind_key(self.drawn_keybinds[idx], data_provider)
-            key.Object = controller_mapping_clip.AddKeyData(key.Tag, key.Caption, localized_key)
+            localized_key = self.localize_keybind_key(option, data_provider)
+            key.Object = add_key_data(key.Tag, key.Caption, localized_key)
 
     def handle_key_rebind(self, data_provider: UObject, key: str) -> None:  # noqa: D102
         idx: int = data_provider.CurrentKeyBindSelection
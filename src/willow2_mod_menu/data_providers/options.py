@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 from unrealsdk import logging
 
@@ -19,16 +20,138 @@ from willow2_mod_menu.options_menu import push_options
 from . import OPTION_EVENT_ID_OFFSET, DataProvider
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from unrealsdk.unreal import UObject
 
 
+type _AddListItemHandler = Callable[[UObject, int, str, Any], None]
+
+
+def _add_button_item(
+    the_list: UObject,
+    event_id: int,
+    option_name: str,
+    option: ButtonOption | NestedOption,  # noqa: ARG001
+) -> None:
+    the_list.AddListItem(event_id, option_name, False)
+
+
+def _add_bool_item(the_list: UObject, event_id: int, option_name: str, option: BoolOption) -> None:
+    the_list.AddSpinnerListItem(
+        event_id,
+        option_name,
+        False,
+        int(option.value),
+        [option.false_text or "Off", option.true_text or "On"],
+    )
+
+
+def _add_choice_item(
+    the_list: UObject,
+    event_id: int,
+    option_name: str,
+    option: DropdownOption | SpinnerOption,
+) -> None:
+    the_list.AddSpinnerListItem(
+        event_id,
+        option_name,
+        False,
+        option.choices.index(option.value),
+        option.choices,
+    )
+
+
+def _add_slider_item(
+    the_list: UObject,
+    event_id: int,
+    option_name: str,
+    option: SliderOption,
+) -> None:
+    value = option.value
+    min_value = option.min_value
+    max_value = option.max_value
+    step = option.step
+
+    # Spelling these checks out rather than using any() over a tuple, this runs for every slider
+    # every time a menu gets populated
+    if (
+        not option.is_integer
+        or round(value) != value
+        or round(min_value) != min_value
+        or round(max_value) != max_value
+        or round(step) != step
+    ):
+        logging.dev_warning(
+            f"'{option.identifier}' is a non-integer slider, which willow2-mod-menu does not"
+            " support due to engine limitations",
+        )
+    if (value % step) != 0 or (min_value % step) != 0 or (max_value % step) != 0:
+        logging.dev_warning(
+            f"'{option.identifier}' uses a slider step which does not evenly divide its values,"
+            " which have have unexpected behaviour in willow2-mod-menu, due to engine limitations",
+        )
+
+    the_list.AddSliderListItem(event_id, option_name, False, value, min_value, max_value, step)
+
+
+def _add_nothing(
+    the_list: UObject,
+    event_id: int,
+    option_name: str,
+    option: KeybindOption,
+) -> None:
+    pass
+
+
+# Grouped options need a lot more context, they're handled separately
+_ADD_LIST_ITEM_HANDLERS: dict[type[BaseOption], _AddListItemHandler] = {
+    ButtonOption: _add_button_item,
+    NestedOption: _add_button_item,
+    BoolOption: _add_bool_item,
+    DropdownOption: _add_choice_item,
+    SpinnerOption: _add_choice_item,
+    SliderOption: _add_slider_item,
+    KeybindOption: _add_nothing,
+}
+
+
+@cache
+def _get_add_list_item_handler(option_type: type[BaseOption]) -> _AddListItemHandler | None:
+    """
+    Gets the function used to add a list item for the given option type.
+
+    Args:
+        option_type: The type of the option to add. Should be the option's `__class__`, which may
+                     differ from its real type.
+    Returns:
+        The handler function, or None if the type is unknown.
+    """
+    # Walk the mro, so that mods can still use their own option subclasses
+    for cls in option_type.__mro__:
+        if (handler := _ADD_LIST_ITEM_HANDLERS.get(cls)) is not None:
+            return handler
+    return None
+
+
 @dataclass
 class OptionsDataProvider(DataProvider):
     options: Sequence[BaseOption]
     drawn_options: list[BaseOption] = field(default_factory=list[BaseOption], repr=False)
 
+    # Caches for option visibility, keyed by the ids of the options/sequences they were worked out
+    # for. Only valid during a single populate call.
+    _option_visible_cache: dict[int, bool] = field(
+        default_factory=dict[int, bool],
+        init=False,
+        repr=False,
+    )
+    _visible_after_cache: dict[int, list[bool]] = field(
+        default_factory=dict[int, list[bool]],
+        init=False,
+        repr=False,
+    )
+
     @staticmethod
     def create_option_description(option: BaseOption) -> str:
         """
@@ -39,16 +162,15 @@ class OptionsDataProvider(DataProvider):
         Returns:
             The option description (which may be an empty string).
         """
-        # If we don't have a special description title, just ignore it - we have limited space
-        if option.display_name == option.description_title:
-            return option.description
+        title = option.description_title
+        description = option.description
 
-        blocks: list[str] = []
-        if option.description_title:
-            blocks.append(option.description_title)
-        if option.description:
-            blocks.append(option.description)
-        return "\n".join(blocks)
+        # If we don't have a special description title, just ignore it - we have limited space
+        if not title or title == option.display_name:
+            return description
+        if not description:
+            return title
+        return f"{title}\n{description}"
 
     @staticmethod
     def any_option_visible(options: Sequence[BaseOption]) -> bool:
@@ -73,6 +195,64 @@ class OptionsDataProvider(DataProvider):
             for option in options
         )
 
+    def is_option_visible(self, option: BaseOption) -> bool:
+        """
+        Checks if a single option is visible, or a group containing a visible option.
+
+        Follows the rules documented on `any_option_visible`, but caches the result for groups, so
+        that each subtree only gets walked once while populating.
+
+        Args:
+            option: The option to check.
+        Returns:
+            True if the option is visible.
+        """
+        if option.is_hidden or isinstance(option, KeybindOption):
+            return False
+        if not isinstance(option, GroupedOption):
+            return True
+
+        cached = self._option_visible_cache.get(id(option))
+        if cached is None:
+            # Count as hidden while checking the children, so a recursive group can't loop forever
+            self._option_visible_cache[id(option)] = False
+            cached = any(self.is_option_visible(child) for child in option.children)
+            self._option_visible_cache[id(option)] = cached
+        return cached
+
+    def is_any_option_visible_after(self, options: Sequence[BaseOption], start_idx: int) -> bool:
+        """
+        Checks if any option in a sequence, starting from the given index, is visible.
+
+        Works out the result for every index of the sequence on first use, so later checks on the
+        same sequence don't need to re-scan it.
+
+        Args:
+            options: The sequence of options to check.
+            start_idx: The index to start checking from.
+        Returns:
+            True if any option from the given index onwards is visible.
+        """
+        visible_after = self._visible_after_cache.get(id(options))
+        if visible_after is None:
+            visible_after = [False] * (len(options) + 1)
+            for idx in range(len(options) - 1, -1, -1):
+                visible_after[idx] = visible_after[idx + 1] or self.is_option_visible(options[idx])
+            self._visible_after_cache[id(options)] = visible_after
+        return visible_after[start_idx]
+
+    def add_drawn_option(self, option: BaseOption) -> int:
+        """
+        Records an option as being drawn, and gets the event id it should be drawn with.
+
+        Args:
+            option: The option being drawn.
+        Returns:
+            The event id to use for the option's list item.
+        """
+        self.drawn_options.append(option)
+        return len(self.drawn_options) - 1 + OPTION_EVENT_ID_OFFSET
+
     def add_grouped_option(
         self,
         data_provider: UObject,
@@ -81,6 +261,8 @@ class OptionsDataProvider(DataProvider):
         group_stack: list[GroupedOption],
         option: GroupedOption,
         options_idx: int,
+        *,
+        group_caption: str = "",
     ) -> None:
         """
         Adds a grouped option to the current scrolling list.
@@ -92,26 +274,26 @@ class OptionsDataProvider(DataProvider):
             group_stack: The stack of currently open grouped options.
             option: The specific grouped option to add.
             options_idx: The index of the specific grouped option being added.
+            group_caption: The header caption for the current group stack.
         """
-        if not self.any_option_visible(option.children):
+        if not self.is_option_visible(option):
             return
 
+        # Extend the caption as we go, rather than re-joining the whole stack each time
+        inner_caption = (
+            f"{group_caption} - {option.display_name}" if group_stack else option.display_name
+        )
         group_stack.append(option)
 
         # If the first entry of the group is another group, don't draw a title, let the
         # nested call do it, so the first title is the most nested
         # If we're empty, or a different type, draw our own header
         if len(option.children) == 0 or not isinstance(option.children[0], GroupedOption):
-            the_list.AddListItem(
-                event_id := (len(self.drawn_options) + OPTION_EVENT_ID_OFFSET),
-                " - ".join(g.display_name for g in group_stack),
-                False,
-            )
+            event_id = self.add_drawn_option(option)
+            the_list.AddListItem(event_id, inner_caption, False)
             data_provider.AddDescription(event_id, self.create_option_description(option))
 
-            self.drawn_options.append(option)
-
-        self.add_option_list(data_provider, the_list, option.children, group_stack)
+        self.add_option_list(data_provider, the_list, option.children, group_stack, inner_caption)
 
         group_stack.pop()
 
@@ -121,24 +303,20 @@ class OptionsDataProvider(DataProvider):
         if (
             group_stack
             and options_idx != len(options) - 1
-            and self.any_option_visible(options[options_idx + 1 :])
+            and self.is_any_option_visible_after(options, options_idx + 1)
             and not isinstance(options[options_idx + 1], GroupedOption)
         ):
-            the_list.AddListItem(
-                event_id := (len(self.drawn_options) + OPTION_EVENT_ID_OFFSET),
-                " - ".join(g.display_name for g in group_stack),
-                False,
-            )
+            event_id = self.add_drawn_option(option)
+            the_list.AddListItem(event_id, group_caption, False)
             data_provider.AddDescription(event_id, self.create_option_description(option))
 
-            self.drawn_options.append(option)
-
-    def add_option_list(  # noqa: C901 - we can't really simplify it, each case is just a single
-        self,  #                         statement, the match just eats a lot
+    def add_option_list(
+        self,
         data_provider: UObject,
         the_list: UObject,
         options: Sequence[BaseOption],
         group_stack: list[GroupedOption],
+        group_caption: str = "",
     ) -> None:
         """
         Adds a list of options to the current scrolling list.
@@ -148,75 +326,24 @@ class OptionsDataProvider(DataProvider):
             the_list: The WillowScrollingList to add to.
             options: The list of options to add.
             group_stack: The stack of currently open grouped options. Should start out empty.
+            group_caption: The header caption for the current group stack. Should start out empty.
         """
+        # If we're in any group, we indent the names slightly to distinguish them from the headers
+        indent = "  " if group_stack else ""
+        # There's no way to add these in bulk, but we can at least only look up the function once
+        add_description = data_provider.AddDescription
+
         for options_idx, option in enumerate(options):
             if option.is_hidden:
                 continue
 
             # Grouped options are a little more complex, it handles this manually
-            if not isinstance(option, GroupedOption):
-                self.drawn_options.append(option)
-
-            event_id = len(self.drawn_options) - 1 + OPTION_EVENT_ID_OFFSET
-
-            # If we're in any group, we indent the names slightly to distinguish them from the
-            # headers
-            option_name = ("  " if group_stack else "") + option.display_name
-
-            match option:
-                case ButtonOption() | NestedOption():
-                    the_list.AddListItem(event_id, option_name, False)
-
-                case BoolOption():
-                    the_list.AddSpinnerListItem(
-                        event_id,
-                        option_name,
-                        False,
-                        int(option.value),
-                        [option.false_text or "Off", option.true_text or "On"],
-                    )
-
-                case DropdownOption() | SpinnerOption():
-                    the_list.AddSpinnerListItem(
-                        event_id,
-                        option_name,
-                        False,
-                        option.choices.index(option.value),
-                        option.choices,
-                    )
-
-                case SliderOption():
-                    if not option.is_integer or any(
-                        round(x) != x
-                        for x in (option.value, option.min_value, option.max_value, option.step)
-                    ):
-                        logging.dev_warning(
-                            f"'{option.identifier}' is a non-integer slider, which willow2-mod-menu"
-                            " does not support due to engine limitations",
-                        )
-                    if any(
-                        (x % option.step) != 0
-                        for x in (option.value, option.min_value, option.max_value)
-                    ):
-                        logging.dev_warning(
-                            f"'{option.identifier}' uses a slider step which does not evenly divide"
-                            " its values, which have have unexpected behaviour in willow2-mod-menu,"
-                            " due to engine limitations",
-                        )
-
-                    the_list.AddSliderListItem(
-                        event_id,
-                        option_name,
-                        False,
-                        option.value,
-                        option.min_value,
-                        option.max_value,
-                        option.step,
-                    )
-
-                case GroupedOption() if option in group_stack:
+            if isinstance(option, GroupedOption):
+                # Options are dataclasses, so `in` would compare every field (including all the
+                # children) against each open group - we only care if it's the exact same object
+                if any(option is group for group in group_stack):
                     logging.dev_warning(f"Found recursive options group, not drawing: {option}")
-                case GroupedOption():
+                else:
                     self.add_grouped_option(
                         data_provider,
                         the_list,
@@ -224,17 +351,26 @@ class OptionsDataProvider(DataProvider):
                         group_stack,
                         option,
                         options_idx,
+                        group_caption=group_caption,
                     )
+                continue
+
+            event_id = self.add_drawn_option(option)
+            option_name = indent + option.display_name
 
-                case KeybindOption():
-                    pass
-                case _:
-                    logging.dev_warning(f"Encountered unknown option type {type(option)}")
+            # Need to use `__class__` rather than `type()` here - save options disguise themselves
+            # as buttons by overriding it when they can't be saved, which `type()` would ignore
+            option_cls = option.__class__
+            if (add_item := _get_add_list_item_handler(option_cls)) is not None:
+                add_item(the_list, event_id, option_name, option)
+            else:
+                logging.dev_warning(f"Encountered unknown option type {option_cls}")
 
-            if not isinstance(option, GroupedOption):
-                data_provider.AddDescription(event_id, self.create_option_description(option))
+            add_description(event_id, self.create_option_description(option))
 
     def populate(self, data_provider: UObject, the_list: UObject) -> None:  # noqa: D102
+        self._option_visible_cache.clear()
+        self._visible_after_cache.clear()
         self.add_option_list(data_provider, the_list, self.options, [])
 
     def populate_keybind_keys(self, data_provider: UObject) -> None:  # noqa: ARG002, D102
@@ -1,5 +1,39 @@
+from functools import cache
+
 from mods_base import CoopSupport, Game, Mod
 
+_COOP_SUPPORT_HEADERS: dict[CoopSupport, str] = {
+    # Choose this size and colour to make it look the same as the author text above it
+    # Can only add one line there, so hiding this at the top of the description
+    CoopSupport.Unknown: "<font size='14' color='#a1e4ef'>Coop Support: Unknown</font>",
+    CoopSupport.Incompatible: (
+        "<font size='14' color='#a1e4ef'>Coop Support:</font>"
+        " <font size='14'color='#ffff00'>Incompatible</font>"
+    ),
+    CoopSupport.RequiresAllPlayers: (
+        "<font size='14' color='#a1e4ef'>Coop Support: Requires All Players</font>"
+    ),
+    CoopSupport.ClientSide: "<font size='14' color='#a1e4ef'>Coop Support: Client Side</font>",
+    CoopSupport.HostOnly: "<font size='14' color='#a1e4ef'>Coop Support: Host Only</font>",
+}
+
+_GAME_NAMES: tuple[tuple[Game, str], ...] = tuple(
+    (game, game.name) for game in Game if game.name is not None
+)
+
+
+@cache
+def _get_supported_games_text(supported_games: Game) -> str:
+    """
+    Gets the comma separated list of game names to display for a set of supported games.
+
+    Args:
+        supported_games: The supported games flag.
+    Returns:
+        The list of game names.
+    """
+    return ", ".join(name for game, name in _GAME_NAMES if game in supported_games)
+
 
 def get_mod_description(mod: Mod, include_author_version: bool) -> str:
     """
@@ -17,29 +51,13 @@ def get_mod_description(mod: Mod, include_author_version: bool) -> str:
     if include_author_version:
         header += f"<font size='14' color='#a1e4ef'>By: {mod.author}\t\t{mod.version}</font>\n"
 
-    match mod.coop_support:
-        case CoopSupport.Unknown:
-            # Choose this size and colour to make it look the same as the author text above it
-            # Can only add one line there, so hiding this at the top of the description
-            header += "<font size='14' color='#a1e4ef'>Coop Support: Unknown</font>"
-        case CoopSupport.Incompatible:
-            header += (
-                "<font size='14' color='#a1e4ef'>Coop Support:</font>"
-                " <font size='14'color='#ffff00'>Incompatible</font>"
-            )
-        case CoopSupport.RequiresAllPlayers:
-            header += "<font size='14' color='#a1e4ef'>Coop Support: Requires All Players</font>"
-        case CoopSupport.ClientSide:
-            header += "<font size='14' color='#a1e4ef'>Coop Support: Client Side</font>"
-        case CoopSupport.HostOnly:
-            header += "<font size='14' color='#a1e4ef'>Coop Support: Host Only</font>"
+    header += _COOP_SUPPORT_HEADERS.get(mod.coop_support, "")
     blocks.append(header)
 
     if Game.get_current() not in mod.supported_games:
-        supported = [g.name for g in Game if g in mod.supported_games and g.name is not None]
         blocks.append(
             "<font color='#ffff00'>Incompatible Game!</font>\n"
-            "This mod supports: " + ", ".join(supported),
+            "This mod supports: " + _get_supported_games_text(mod.supported_games),
         )
 
     if mod.description:
@@ -14,10 +14,12 @@ def toggle_favourite(mod: Mod) -> None:
     if mod == base_mod:
         return
 
-    if mod.name in favourites_option.value:
-        favourites_option.value.remove(mod.name)
-    else:
-        favourites_option.value.append(mod.name)
+    # Removing straight away only scans the list once, rather than checking if it's in it first
+    favourites = favourites_option.value
+    try:
+        favourites.remove(mod.name)
+    except ValueError:
+        favourites.append(mod.name)
 
     base_mod.save_settings()
 
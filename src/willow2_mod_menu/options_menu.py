@@ -45,14 +45,14 @@ input_binding_clip_to_fixup: WeakPointer = WeakPointer()
 MIN_OK_INPUT_BINDING_CLIP_ASPECT_RATIO = 1.6
 
 
-def push_options(the_list: UObject, screen_name: str, options: Sequence[BaseOption]) -> None:
+def _push_data_provider(the_list: UObject, screen_name: str, data_provider: DataProvider) -> None:
     """
-    Pushes a screen containing the given set of options.
+    Pushes a new options screen backed by the given data provider.
 
     Args:
         the_list: The option menu's WillowScrollingList to push to.
-        screen_name: The name of this screen, use din the header.
-        options: The options which should be included in this screen.
+        screen_name: The name of this screen, used in the header.
+        data_provider: The data provider which should populate this screen.
     """
     provider = unrealsdk.construct_object(
         "WillowScrollingListDataProviderKeyboardMouseOptions",
@@ -60,13 +60,25 @@ def push_options(the_list: UObject, screen_name: str, options: Sequence[BaseOpti
     )
     provider.MenuDisplayName = screen_name
 
-    data_provider_stack.append(OptionsDataProvider(options))
+    data_provider_stack.append(data_provider)
     the_list.PushDataProvider(provider)
 
     global latest_list
     latest_list = WeakPointer(the_list)
 
 
+def push_options(the_list: UObject, screen_name: str, options: Sequence[BaseOption]) -> None:
+    """
+    Pushes a screen containing the given set of options.
+
+    Args:
+        the_list: The option menu's WillowScrollingList to push to.
+        screen_name: The name of this screen, used in the header.
+        options: The options which should be included in this screen.
+    """
+    _push_data_provider(the_list, screen_name, OptionsDataProvider(options))
+
+
 def push_mod_options(the_list: UObject, mod: Mod) -> None:
     """
     Pushes a screen containing all the options for the given mod.
@@ -75,17 +87,7 @@ def push_mod_options(the_list: UObject, mod: Mod) -> None:
         the_list: The option menu's WillowScrollingList to push to.
         mod: The mod to add options for.
     """
-    provider = unrealsdk.construct_object(
-        "WillowScrollingListDataProviderKeyboardMouseOptions",
-        ENGINE.Outer,
-    )
-    provider.MenuDisplayName = mod.name
-
-    data_provider_stack.append(ModOptionsDataProvider(mod=mod))
-    the_list.PushDataProvider(provider)
-
-    global latest_list
-    latest_list = WeakPointer(the_list)
+    _push_data_provider(the_list, mod.name, ModOptionsDataProvider(mod=mod))
 
 
 def push_mod_list(the_list: UObject) -> None:
@@ -95,17 +97,7 @@ def push_mod_list(the_list: UObject) -> None:
     Args:
         the_list: The option menu's WillowScrollingList to push to.
     """
-    provider = unrealsdk.construct_object(
-        "WillowScrollingListDataProviderKeyboardMouseOptions",
-        ENGINE.Outer,
-    )
-    provider.MenuDisplayName = "MODS"
-
-    data_provider_stack.append(ModListDataProvider())
-    the_list.PushDataProvider(provider)
-
-    global latest_list
-    latest_list = WeakPointer(the_list)
+    _push_data_provider(the_list, "MODS", ModListDataProvider())
 
 
 # Avoid circular imports
@@ -13,6 +13,7 @@ from .favourites import is_favourite, toggle_favourite
 from .options_menu import push_mod_list, push_mod_options
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from enum import auto
 
     from unrealsdk.unreal import BoundFunction, UObject, WrappedStruct
@@ -48,7 +49,19 @@ FRIENDLY_DISPLAY_VERSION = unrealsdk.config.get("willow2_mod_menu", {}).get(
     base_mod.version,
 )
 
+DLC_CAPTION = "$WillowMenu.WillowScrollingListDataProviderFrontEnd.DLC"
+# The final entries of each menu, which we add the mods entry right before
+INJECT_MODS_BEFORE_CAPTIONS = frozenset(
+    {
+        "$WillowMenu.WillowScrollingListDataProviderFrontEnd.Disconnect",
+        "$WillowMenu.WillowScrollingListDataProviderFrontEnd.Quit",
+        "$WillowMenu.WillowScrollingListDataProviderPause.Exit",
+    },
+)
+
 drawn_mod_list: list[Mod] = []
+# Maps the offering id string each drawn mod was given back to the mod, so we don't need to parse it
+drawn_mod_offerings: dict[str, Mod] = {}
 
 
 # This hook is called any time any item is added to the scrolling list menus
@@ -61,22 +74,18 @@ def add_list_item(
     _3: Any,
     _4: BoundFunction,
 ) -> type[Block] | None:
-    match args.Caption:
-        case "$WillowMenu.WillowScrollingListDataProviderFrontEnd.DLC":
-            return Block
-        case (
-            "$WillowMenu.WillowScrollingListDataProviderFrontEnd.Disconnect"
-            | "$WillowMenu.WillowScrollingListDataProviderFrontEnd.Quit"
-            | "$WillowMenu.WillowScrollingListDataProviderPause.Exit"
-        ):
-            # Add the mod entry right before the final option in the menu
-            # Need to do it here, rather than while removing DLC, since the DLC menu does not exist
-            # in AoDK or in the pause screen
-            with prevent_hooking_direct_calls():
-                obj.AddListItem(MODS_EVENT_ID, MODS_MENU_NAME, False, False)
-            return None
-        case _:
-            return None
+    caption: str = args.Caption
+    if caption == DLC_CAPTION:
+        return Block
+
+    if caption in INJECT_MODS_BEFORE_CAPTIONS:
+        # Add the mod entry right before the final option in the menu
+        # Need to do it here, rather than while removing DLC, since the DLC menu does not exist in
+        # AoDK or in the pause screen
+        with prevent_hooking_direct_calls():
+            obj.AddListItem(MODS_EVENT_ID, MODS_MENU_NAME, False, False)
+
+    return None
 
 
 # These hooks are called to generate the relevant menu entries, we use them to enable and disable
@@ -113,29 +122,31 @@ def frontend_update_tooltips(
         return Block
 
     spacing: str = obj.TooltipSpacing
-
-    tooltip: str = spacing + obj.SelectTooltip
+    is_client = obj.WPCOwner.WorldInfo.NetMode == ENetMode.NM_Client
 
     cancel: str = obj.CancelString
-    if (
-        obj.WPCOwner.WorldInfo.NetMode == ENetMode.NM_Client
-        and len(obj.TheList.DataProviderStack) <= 1
-    ):
+    if is_client and len(obj.TheList.DataProviderStack) <= 1:
         cancel = obj.DisconnectString
-    tooltip += spacing + obj.CancelTooltip.replace("%PLAYER1", cancel)
 
-    tooltip += "\n"
+    parts: list[str] = [
+        spacing,
+        obj.SelectTooltip,
+        spacing,
+        obj.CancelTooltip.replace("%PLAYER1", cancel),
+        "\n",
+    ]
 
     if obj.CanShowSpectatorControls():
-        tooltip += spacing + obj.SpectatorTooltip
+        parts += (spacing, obj.SpectatorTooltip)
 
     if obj.CanShowCharacterSelect(-1):
-        tooltip += spacing + obj.CharacterSelectTooltip
+        parts += (spacing, obj.CharacterSelectTooltip)
 
-    if obj.WPCOwner.WorldInfo.NetMode != ENetMode.NM_Client:
-        tooltip += spacing + obj.NetworkOptionsTooltip
+    if not is_client:
+        parts += (spacing, obj.NetworkOptionsTooltip)
 
-    tooltip += spacing + "[M] Mods"
+    parts += (spacing, "[M] Mods")
+    tooltip = "".join(parts)
 
     obj.SetVariableString(frontend_def.TooltipPath, obj.ResolveDataStoreMarkup(tooltip))
     return Block
@@ -216,24 +227,41 @@ def marketplace_refresh(obj: UObject, _2: WrappedStruct, _3: Any, _4: BoundFunct
 
     obj.SetStoreHeader("Mods", False, FRIENDLY_DISPLAY_VERSION, "SDK Mod Manager")
 
+    # Look up everything we use on the movie once, rather than once per mod
+    create_marketplace_item = obj.CreateMarketplaceItem
+    add_content_data = obj.AddContentData
+    prop_offering_id = obj.Prop_offeringId
+    prop_content_title_text = obj.Prop_contentTitleText
+    prop_cost_text = obj.Prop_costText
+    prop_description_text = obj.Prop_descriptionText
+    prop_status_text = obj.Prop_statusText
+    prop_message_text = obj.Prop_messageText
+    prop_is_new_offer = obj.Prop_isNewOffer
+    # This gets copied into the call, so we can reuse the same empty struct for every item
+    empty_content = unrealsdk.make_struct("MarketplaceContent")
+
     drawn_mod_list[:] = get_ordered_mod_list()
+    drawn_mod_offerings.clear()
     for idx, mod in enumerate(drawn_mod_list):
-        item, _ = obj.CreateMarketplaceItem(unrealsdk.make_struct("MarketplaceContent"))
+        item, _ = create_marketplace_item(empty_content)
 
-        item.SetString(obj.Prop_offeringId, str(idx))
-        item.SetString(obj.Prop_contentTitleText, mod.name)
-        item.SetString(obj.Prop_costText, "By " + mod.author)
-        item.SetString(obj.Prop_descriptionText, get_mod_description(mod, False))
+        offering_id = str(idx)
+        drawn_mod_offerings[offering_id] = mod
+
+        item.SetString(prop_offering_id, offering_id)
+        item.SetString(prop_content_title_text, mod.name)
+        item.SetString(prop_cost_text, "By " + mod.author)
+        item.SetString(prop_description_text, get_mod_description(mod, False))
         item.SetString(
-            obj.Prop_statusText,
+            prop_status_text,
             # Same colour as author again
             f'<font color="#a1e4ef">{mod.version}</font>',
         )
-        item.SetString(obj.Prop_messageText, mod.get_status())
+        item.SetString(prop_message_text, mod.get_status())
         # For some odd reason this (and a bunch of the other bools we ignore), take input as floats
-        item.SetFloat(obj.Prop_isNewOffer, float(is_favourite(mod)))
+        item.SetFloat(prop_is_new_offer, float(is_favourite(mod)))
 
-        obj.AddContentData(item)
+        add_content_data(item)
 
     obj.PostContentLoaded(True)
 
@@ -252,9 +280,7 @@ def marketplace_offering_changed(
         return Block
     obj.PlayUISound("VerticalMovement")
 
-    try:
-        mod = drawn_mod_list[int(data.GetString(obj.Prop_offeringId))]
-    except ValueError, KeyError:
+    if (mod := drawn_mod_offerings.get(data.GetString(obj.Prop_offeringId))) is None:
         return Block
 
     favourite_tooltip = (
@@ -284,7 +310,7 @@ def get_selected_mod(movie: UObject) -> Mod | None:
     return (
         None
         if (item := movie.GetSelectedObject()) is None
-        else drawn_mod_list[int(item.GetString(movie.Prop_offeringId))]
+        else drawn_mod_offerings.get(item.GetString(movie.Prop_offeringId))
     )
 
 
@@ -344,6 +370,22 @@ def handle_show_mod_details(movie: UObject) -> None:
     frontend_options_hide_reopen_mod_menu.enable()
 
 
+# Page up/down are actually bugged on Gearbox's end: they look for both a released event and a
+# pressed or repeat, which is a contradiction that can never be true.
+# Since there can be quite a few mods and we want to be able to scroll through them quick, we're
+# fixing Gearbox's bug here
+DLC_MENU_KEY_ACTIONS: dict[tuple[str, EInputEvent], Callable[[UObject], None]] = {
+    ("PageUp", EInputEvent.IE_Pressed): lambda movie: movie.ScrollDescription(True),
+    ("PageUp", EInputEvent.IE_Repeat): lambda movie: movie.ScrollDescription(True),
+    ("PageDown", EInputEvent.IE_Pressed): lambda movie: movie.ScrollDescription(False),
+    ("PageDown", EInputEvent.IE_Repeat): lambda movie: movie.ScrollDescription(False),
+    ("Q", EInputEvent.IE_Released): handle_toggle_favourite,
+    ("SpaceBar", EInputEvent.IE_Released): handle_toggle_mod,
+    ("Enter", EInputEvent.IE_Released): handle_show_mod_details,
+}
+DLC_MENU_BLOCKED_KEYS = frozenset({"Enter", "Q", "E"})
+
+
 # Called on any key input in the DLC menu. We basically entirely overwrite it to add our own logic.
 @hook("WillowGame.MarketplaceGFxMovie:ShopInputKey", immediately_enable=True)
 def marketplace_input_key(
@@ -357,40 +399,15 @@ def marketplace_input_key(
 
     try:
         event: EInputEvent = args.uevent
-
-        match key, event:
-            # Page up/down are actually bugged on Gearbox's end: they look for both a released event
-            # and a pressed or repeat, which is a contradiction that can never be true.
-            # Since there can be quite a few mods and we want to be able to scroll through them
-            # quick, we're fixing Gearbox's bug here
-            case "PageUp", (EInputEvent.IE_Pressed | EInputEvent.IE_Repeat):
-                obj.ScrollDescription(True)
-                return Block, True
-            case "PageDown", (EInputEvent.IE_Pressed | EInputEvent.IE_Repeat):
-                obj.ScrollDescription(False)
-                return Block, True
-
-            case "Q", EInputEvent.IE_Released:
-                handle_toggle_favourite(obj)
-                return Block, True
-
-            case "SpaceBar", EInputEvent.IE_Released:
-                handle_toggle_mod(obj)
-                return Block, True
-
-            case "Enter", EInputEvent.IE_Released:
-                handle_show_mod_details(obj)
-                return Block, True
-
-            case _, _:
-                pass
-
+        if (action := DLC_MENU_KEY_ACTIONS.get((key, event))) is not None:
+            action(obj)
+            return Block, True
     except Exception:  # noqa: BLE001
         traceback.print_exc()
 
     # These inputs trigger logic in the standard menu, block them all, even if we got an exception.
     # If we let them through it usually ends up opening the steam store page.
-    if key in {"Enter", "Q", "E"}:
+    if key in DLC_MENU_BLOCKED_KEYS:
         return Block, True
 
     return None